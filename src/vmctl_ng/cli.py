@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import argparse
-import subprocess
+import os
+import re
 import sys
-from getpass import getpass
+import threading
 import shlex
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
 
-from .config import ConfigError, find_config_path, load_config
+if TYPE_CHECKING:
+    import subprocess
+
+# Heavier modules (subprocess, getpass, concurrent.futures and the config
+# loader with PyYAML) are imported where they are used so that --help and
+# argument errors stay fast.
 
 
 EXIT_CONFIG = 2
@@ -14,6 +23,91 @@ EXIT_NOT_FOUND = 3
 EXIT_REMOTE = 4
 EXIT_SUDO = 5
 
+GUEST_ACTIONS = ("start", "stop", "status", "shutdown", "reboot")
+ACTION_VERBS = {
+    "start": "started",
+    "stop": "stopped",
+    "status": "status checked",
+    "shutdown": "shut down",
+    "reboot": "rebooted",
+}
+
+# Last sudo password typed per remote user name, tried on other nodes before
+# prompting again. Dropped as soon as sudo rejects it. Prompts only ever run
+# on the main thread; the lock guards the dict against list pool workers.
+_SUDO_PASSWORDS: dict[str, str] = {}
+_SUDO_PASSWORDS_LOCK = threading.Lock()
+# Returned by list pool workers that need a sudo password nobody has typed
+# yet; the main thread then prompts. Never used as an exit code.
+_NEEDS_SUDO_PASSWORD = -1
+
+# ssh processes currently running, so a failing `list --strict` can stop
+# the other nodes' calls instead of waiting for them.
+_SSH_PROCESSES: set[subprocess.Popen[bytes]] = set()
+_SSH_PROCESSES_LOCK = threading.Lock()
+_SSH_ABORTED = False
+
+# Reuse one SSH connection per node for all commands of an invocation (and
+# for ControlPersist seconds afterwards) instead of a full handshake per call.
+SSH_CONTROL_DIR = "~/.ssh"
+SSH_MULTIPLEX_OPTIONS = (
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    "ControlPersist=60s",
+    "-o",
+    f"ControlPath={SSH_CONTROL_DIR}/vmctl-ng-%C",
+)
+
+# Case-insensitive matching avoids copying the whole output with lower()
+# before scanning it. The lookaheads keep the original "all three words,
+# any order" semantics (e.g. "a terminal is required to read the password").
+_SUDO_PASSWORD_REQUIRED_RE = re.compile(
+    r"\A(?=.*sudo)(?=.*password)(?=.*required)",
+    re.IGNORECASE | re.DOTALL,
+)
+_SUDO_AUTH_FAILED_RE = re.compile(
+    r"sorry, try again|incorrect password|authentication failure",
+    re.IGNORECASE,
+)
+# sudo fails before the remote command produces anything, so its messages
+# sit at the end of a stream. Only the tail of stderr and stdout is scanned,
+# which keeps detection cheap on large qm/pct outputs.
+_SUDO_SCAN_TAIL = 4096
+
+LIST_QM_MARKER = "__VMCTL_QM__"
+LIST_PCT_MARKER = "__VMCTL_PCT__"
+LIST_PCT_STATUS_MARKER = "__VMCTL_PCT_STATUS__"
+GUEST_RESULT_MARKER = "__VMCTL_RESULT__"
+# "<marker><guest id> <exit code>" on stderr after each batched command; the
+# stderr text since the previous marker belongs to that command.
+_GUEST_RESULT_RE = re.compile(rf"^{GUEST_RESULT_MARKER}(\d+) (\d+)\n?", re.MULTILINE)
+# Marker lines in the list script output; sections are sliced between them.
+_LIST_MARKER_RE = re.compile(
+    rf"^(?:{LIST_QM_MARKER}|{LIST_PCT_MARKER}|{LIST_PCT_STATUS_MARKER}(\d+))$",
+    re.MULTILINE,
+)
+
+# First non-blank line of a qm/pct table; rows are matched in place after it
+# so the output is never copied or split into lines.
+_TABLE_HEADER_RE = re.compile(r"^[ \t]*\S.*$", re.MULTILINE)
+
+# "status: <state>" line of pct status; found in place, so warnings that
+# 2>&1 put before it are still skipped without splitting into lines.
+_PCT_STATUS_RE = re.compile(r"^[ \t]*status:(.*)$", re.IGNORECASE | re.MULTILINE)
+
+# Header spellings accepted for the columns read from qm/pct list output.
+ID_COLUMNS = ("VMID", "CTID", "ID")
+STATUS_COLUMNS = ("STATUS", "STATE")
+
+
+class GuestRow(NamedTuple):
+    node_name: str
+    vmid: int
+    name: str
+    status: str
+    guest_type: str
+
 
 def _print_error(message: str) -> None:
     print(f"error: {message}", file=sys.stderr)
@@ -36,78 +130,166 @@ def _sudo_required_message(command_label: str, node_name: str, host: str) -> str
     )
 
 
-def _is_sudo_password_required(output: str) -> bool:
-    lower = output.lower()
-    return "sudo" in lower and "password" in lower and "required" in lower
+def _is_sudo_password_required(stdout: str, stderr: str) -> bool:
+    return (
+        _SUDO_PASSWORD_REQUIRED_RE.search(stderr[-_SUDO_SCAN_TAIL:]) is not None
+        or _SUDO_PASSWORD_REQUIRED_RE.search(stdout[-_SUDO_SCAN_TAIL:]) is not None
+    )
 
 
-def _is_sudo_auth_failed(output: str) -> bool:
-    lower = output.lower()
+def _is_sudo_auth_failed(stdout: str, stderr: str) -> bool:
     return (
-        "sorry, try again" in lower
-        or "incorrect password" in lower
-        or "authentication failure" in lower
+        _SUDO_AUTH_FAILED_RE.search(stderr[-_SUDO_SCAN_TAIL:]) is not None
+        or _SUDO_AUTH_FAILED_RE.search(stdout[-_SUDO_SCAN_TAIL:]) is not None
     )
 
 
-def _build_ssh_command(
+@lru_cache(maxsize=None)
+def _ssh_prefix(
     host: str,
     user: str,
     port: int,
-    remote_cmd: str,
-    identity_file: str | None = None,
-    identities_only: bool = False,
-    ssh_options: list[str] | None = None,
-) -> list[str]:
-    ssh_cmd = ["ssh", "-p", str(port)]
+    identity_file: str | None,
+    identities_only: bool,
+    ssh_options: tuple[str, ...],
+    multiplex: bool,
+    compression: bool,
+) -> tuple[str, ...]:
+    # No remote command needs a terminal (passwords go to sudo -S on stdin),
+    # so skip PTY allocation. It comes first so a user-supplied -t still wins.
+    ssh_cmd = ["ssh", "-T", "-p", str(port)]
     if identity_file:
         ssh_cmd.extend(["-i", identity_file])
     if identities_only:
         ssh_cmd.extend(["-o", "IdentitiesOnly=yes"])
-    if ssh_options:
-        for opt in ssh_options:
-            if opt.startswith("-"):
-                ssh_cmd.append(opt)
-            else:
-                ssh_cmd.extend(["-o", opt])
+    if compression:
+        ssh_cmd.append("-C")
+    for opt in ssh_options:
+        if opt.startswith("-"):
+            ssh_cmd.append(opt)
+        else:
+            ssh_cmd.extend(["-o", opt])
+    if multiplex:
+        ssh_cmd.extend(SSH_MULTIPLEX_OPTIONS)
     ssh_cmd.append(f"{user}@{host}")
-    ssh_cmd.append(remote_cmd)
-    return ssh_cmd
+    return tuple(ssh_cmd)
+
+
+def _build_ssh_prefix(node) -> tuple[str, ...]:
+    # Everything up to the remote command depends only on the node, so it is
+    # built once per node and reused by every call against it.
+    return _ssh_prefix(
+        node.host,
+        node.user.name,
+        node.port,
+        node.user.identity_file,
+        node.user.identities_only,
+        tuple(node.ssh_options),
+        node.ssh_multiplex,
+        node.ssh_compression,
+    )
+
+
+def _build_ssh_command(node, remote_cmd: str) -> list[str]:
+    return [*_build_ssh_prefix(node), remote_cmd]
 
 
 def _format_ssh_command(cmd: list[str]) -> str:
     return " ".join(shlex.quote(arg) for arg in cmd)
 
 
+def _sudo_remote_command(command: str, sudo_flags: str, script: bool = False) -> str:
+    # LC_ALL=C keeps qm/pct table headers and sudo's own messages in the
+    # untranslated form the parsers and sudo detection expect.
+    if not script:
+        return f"LC_ALL=C sudo {sudo_flags} {command}"
+    # Scripts run as the login user and call run_sudo per privileged command,
+    # so sudoers rules scoped to qm/pct keep working. With -S the password is
+    # read once from stdin and replayed to every sudo invocation.
+    if "-S" in sudo_flags.split():
+        prelude = (
+            "IFS= read -r vmctl_pw\n"
+            f"run_sudo() {{ printf '%s\\n' \"$vmctl_pw\" | sudo {sudo_flags} \"$@\"; }}\n"
+        )
+    else:
+        prelude = f"run_sudo() {{ sudo {sudo_flags} \"$@\"; }}\n"
+    return f"LC_ALL=C sh -c {shlex.quote(prelude + command)}"
+
+
 def _run_ssh_sudo_command(
-    host: str,
-    user: str,
-    port: int,
+    node,
     command: str,
     sudo_flags: str = "-n",
     input_text: str | None = None,
-    identity_file: str | None = None,
-    identities_only: bool = False,
-    ssh_options: list[str] | None = None,
+    script: bool = False,
+    capture_stdout: bool = True,
 ) -> subprocess.CompletedProcess[str]:
-    remote_cmd = f"sudo {sudo_flags} {command}"
-    ssh_cmd = _build_ssh_command(
-        host,
-        user,
-        port,
-        remote_cmd,
-        identity_file=identity_file,
-        identities_only=identities_only,
-        ssh_options=ssh_options,
-    )
-    return subprocess.run(
+    import subprocess
+
+    ssh_cmd = _build_ssh_command(node, _sudo_remote_command(command, sudo_flags, script=script))
+    if not capture_stdout:
+        # Remote stdout goes straight to our stdout; flush first so anything
+        # already printed stays in order.
+        sys.stdout.flush()
+    input_bytes = input_text.encode() if input_text is not None else None
+    if input_bytes is not None:
+        stdin = subprocess.PIPE
+    elif capture_stdout:
+        # Captured calls may run in the list pool while the main thread sits
+        # in getpass; ssh must not read (and forward) the typed password.
+        stdin = subprocess.DEVNULL
+    else:
+        stdin = None
+    # Same as subprocess.run, but the process is registered so that
+    # _abort_ssh_processes can stop it from another thread.
+    with subprocess.Popen(
         ssh_cmd,
-        capture_output=True,
-        text=True,
-        input=input_text,
+        stdin=stdin,
+        stdout=subprocess.PIPE if capture_stdout else None,
+        stderr=subprocess.PIPE,
+    ) as process:
+        with _SSH_PROCESSES_LOCK:
+            _SSH_PROCESSES.add(process)
+            if _SSH_ABORTED:
+                process.terminate()
+        try:
+            while True:
+                try:
+                    stdout, stderr = process.communicate(input_bytes, timeout=0.2)
+                    break
+                except subprocess.TimeoutExpired:
+                    if _SSH_ABORTED:
+                        # Anything ssh left behind may still hold the pipes
+                        # open, so stop reading instead of waiting for EOF.
+                        process.kill()
+                        stdout, stderr = (b"" if capture_stdout else None), b""
+                        break
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            with _SSH_PROCESSES_LOCK:
+                _SSH_PROCESSES.discard(process)
+    # Decode once here instead of through text-mode pipe wrappers; invalid
+    # bytes (e.g. a guest name in another encoding) must not abort the run.
+    return subprocess.CompletedProcess(
+        ssh_cmd,
+        process.returncode,
+        stdout.decode("utf-8", "replace") if stdout is not None else None,
+        stderr.decode("utf-8", "replace"),
     )
 
 
+def _abort_ssh_processes() -> None:
+    # Stops every ssh call in flight and any started afterwards; used when
+    # `list --strict` gives up on the first failing node.
+    global _SSH_ABORTED
+    with _SSH_PROCESSES_LOCK:
+        _SSH_ABORTED = True
+        for process in _SSH_PROCESSES:
+            process.terminate()
+
+
 def _run_sudo_with_password_retry(
     args: argparse.Namespace,
     node_name: str,
@@ -115,38 +297,54 @@ def _run_sudo_with_password_retry(
     command: str,
     command_label: str,
     emit_errors: bool = True,
+    script: bool = False,
+    capture_stdout: bool = True,
+    prompt: bool = True,
+    log: bool = True,
 ) -> tuple[int, str, str]:
-    for attempt in range(1, 4):
-        password = getpass(f"Password for sudo on node '{node_name}' ({node.host}): ")
-        ssh_cmd = _build_ssh_command(
-            node.host,
-            node.user.name,
-            node.port,
-            f"sudo -S -p '' {command}",
-            identity_file=node.user.identity_file,
-            identities_only=node.user.identities_only,
-            ssh_options=node.ssh_options,
-        )
-        _log_debug(args, f"→ SSH: {_format_ssh_command(ssh_cmd)}")
+    from getpass import getpass
+
+    attempt = 0
+    rejected = None
+    while attempt < 3:
+        with _SUDO_PASSWORDS_LOCK:
+            password = _SUDO_PASSWORDS.get(node.user.name)
+        from_cache = password is not None and password != rejected
+        if not from_cache:
+            if not prompt:
+                return _NEEDS_SUDO_PASSWORD, "", ""
+            attempt += 1
+            password = getpass(f"Password for sudo on node '{node_name}' ({node.host}): ")
+            with _SUDO_PASSWORDS_LOCK:
+                _SUDO_PASSWORDS[node.user.name] = password
+        if log and args.debug:
+            ssh_cmd = _build_ssh_command(
+                node,
+                _sudo_remote_command(command, "-S -p ''", script=script),
+            )
+            _log_debug(args, f"→ SSH: {_format_ssh_command(ssh_cmd)}")
         retry = _run_ssh_sudo_command(
-            node.host,
-            node.user.name,
-            node.port,
+            node,
             command,
             sudo_flags="-S -p ''",
             input_text=f"{password}\n",
-            identity_file=node.user.identity_file,
-            identities_only=node.user.identities_only,
-            ssh_options=node.ssh_options,
+            script=script,
+            capture_stdout=capture_stdout,
         )
-        password = ""
-        retry_output = (retry.stdout or "") + (retry.stderr or "")
-        _log_debug(args, f"→ stdout: {retry.stdout or ''}")
-        _log_debug(args, f"→ stderr: {retry.stderr or ''}")
+        retry_stdout = retry.stdout or ""
+        retry_stderr = retry.stderr or ""
+        if log:
+            _log_debug(args, f"→ stdout: {retry_stdout}")
+            _log_debug(args, f"→ stderr: {retry_stderr}")
         if retry.returncode == 0:
-            return 0, retry.stdout or "", ""
-        if _is_sudo_auth_failed(retry_output):
-            if attempt < 3:
+            return 0, retry_stdout, ""
+        if _is_sudo_auth_failed(retry_stdout, retry_stderr):
+            with _SUDO_PASSWORDS_LOCK:
+                if _SUDO_PASSWORDS.get(node.user.name) == password:
+                    del _SUDO_PASSWORDS[node.user.name]
+            rejected = password
+            password = ""
+            if from_cache or attempt < 3:
                 continue
             message = (
                 f"sudo authentication failed after 3 attempts on node '{node_name}' ({node.host})"
@@ -154,7 +352,7 @@ def _run_sudo_with_password_retry(
             if emit_errors:
                 _print_error(message)
             return EXIT_SUDO, "", message
-        message = retry_output.strip() or "Remote command failed"
+        message = (retry_stdout + retry_stderr).strip() or "Remote command failed"
         if emit_errors:
             _print_error(message)
         return EXIT_REMOTE, "", message
@@ -165,9 +363,11 @@ def _run_sudo_with_password_retry(
 
 
 def _load_config_from_args(args: argparse.Namespace):
+    from .config import ConfigError, find_config_path, load_config_cached
+
     try:
         config_path = find_config_path(args.config)
-        return load_config(config_path)
+        return load_config_cached(config_path)
     except ConfigError as exc:
         _print_error(str(exc))
         sys.exit(EXIT_CONFIG)
@@ -178,15 +378,7 @@ def _resolve_guest_target(
     target: str,
 ) -> tuple[str, str, int, str]:
     if target.isdigit():
-        target_id = int(target)
-        matches: list[tuple[str, str, int, str]] = []
-        for node_name, node in config.nodes.items():
-            for name, vmid in node.vms.items():
-                if vmid == target_id:
-                    matches.append((node_name, "VM", vmid, name))
-            for name, ctid in node.lxcs.items():
-                if ctid == target_id:
-                    matches.append((node_name, "LXC", ctid, name))
+        matches = config.guest_id_index.get(int(target), [])
         if not matches:
             _print_error(f"Unknown guest ID: {target}")
             raise SystemExit(EXIT_NOT_FOUND)
@@ -195,151 +387,204 @@ def _resolve_guest_target(
             raise SystemExit(EXIT_NOT_FOUND)
         return matches[0]
 
-    matches_by_name: list[tuple[str, str, int, str]] = []
-    for node_name, node in config.nodes.items():
-        if target in node.vms:
-            matches_by_name.append((node_name, "VM", node.vms[target], target))
-        if target in node.lxcs:
-            matches_by_name.append((node_name, "LXC", node.lxcs[target], target))
-    if not matches_by_name:
+    matches = config.guest_name_index.get(target, [])
+    if not matches:
         _print_error(f"Unknown guest name: {target}")
         raise SystemExit(EXIT_NOT_FOUND)
-    if len(matches_by_name) > 1:
+    if len(matches) > 1:
         _print_error(f"Guest name is not unique: {target}")
         raise SystemExit(EXIT_NOT_FOUND)
-    return matches_by_name[0]
+    return matches[0]
 
 
-def _handle_vm_action(args: argparse.Namespace) -> int:
-    config = _load_config_from_args(args)
+def _report_guest_actions(
+    args: argparse.Namespace,
+    node_name: str,
+    guests: list[tuple[str, int, str]],
+    stderr: str = "",
+) -> None:
+    # Prints an OK line or an error for every guest from the result markers
+    # in stderr. Without markers (single guest, or a failure before any
+    # command ran) stderr is one node-level error.
+    results: dict[int, tuple[int, str]] = {}
+    pos = 0
+    for marker in _GUEST_RESULT_RE.finditer(stderr):
+        results[int(marker.group(1))] = (int(marker.group(2)), stderr[pos : marker.start()].strip())
+        pos = marker.end()
+    rest = stderr[pos:].strip()
+    verb = ACTION_VERBS.get(args.action, args.action)
+    for guest_type, guest_id, guest_name in guests:
+        label = f"{guest_type} {guest_name} ({guest_id})"
+        if guest_id not in results:
+            if results:
+                _print_error(f"{label}: not attempted")
+            elif not stderr:
+                print(f"OK: {label} {verb} on {node_name}")
+            continue
+        returncode, message = results[guest_id]
+        if returncode == 0:
+            print(f"OK: {label} {verb} on {node_name}")
+        else:
+            _print_error(f"{label}: {message or 'Remote command failed'}")
+    if rest or (stderr and not results):
+        _print_error(rest or "Remote command failed")
+
 
-    node_name, guest_type, guest_id, guest_name = _resolve_guest_target(config, args.vmname)
-    node = config.nodes[node_name]
-    command = "qm" if guest_type == "VM" else "pct"
+def _run_node_guest_actions(
+    args: argparse.Namespace,
+    node_name: str,
+    node,
+    guests: list[tuple[str, int, str]],
+) -> int:
+    commands = [
+        f"{'qm' if guest_type == 'VM' else 'pct'} {args.action} {guest_id}"
+        for guest_type, guest_id, _guest_name in guests
+    ]
+    command_label = "/".join(
+        label
+        for label, guest_type in (("qm", "VM"), ("pct", "LXC"))
+        if any(guest[0] == guest_type for guest in guests)
+    )
     _log_verbose(args, f"→ Target node: {node_name} ({node.host})")
-    _log_verbose(args, f"→ Executing: {command} {args.action} {guest_id}")
+    for command in commands:
+        _log_verbose(args, f"→ Executing: {command}")
+    # Several guests on one node share a single ssh session. Every command
+    # runs even if an earlier one fails; each reports its exit code on stderr
+    # so results are printed per guest, and the script exits with the first
+    # failing code.
+    script = len(guests) > 1
+    if script:
+        # Each command's stdout is printed under a header naming its guest,
+        # so lines like "status: running" can be told apart. Empty output
+        # gets no header, which also keeps a failed sudo -n attempt silent.
+        remote = "status=0\n" + "".join(
+            f"out=$(run_sudo {command}); rc=$?\n"
+            f'[ -z "$out" ] || printf "%s\\n%s\\n" '
+            f"{shlex.quote(f'{guest_type} {guest_name} ({guest_id}):')} \"$out\"\n"
+            f"echo {GUEST_RESULT_MARKER}{guest_id} $rc >&2\n"
+            f'[ "$status" -ne 0 ] || status=$rc\n'
+            for command, (guest_type, guest_id, guest_name) in zip(commands, guests)
+        ) + 'exit "$status"\n'
+    else:
+        remote = commands[0]
     if args.debug:
-        _log_debug(
-            args,
-            f"→ Resolved guest: name={guest_name} id={guest_id} type={guest_type} node={node_name}",
-        )
-        ssh_cmd = _build_ssh_command(
-            node.host,
-            node.user.name,
-            node.port,
-            f"sudo -n {command} {args.action} {guest_id}",
-            identity_file=node.user.identity_file,
-            identities_only=node.user.identities_only,
-            ssh_options=node.ssh_options,
-        )
+        for guest_type, guest_id, guest_name in guests:
+            _log_debug(
+                args,
+                f"→ Resolved guest: name={guest_name} id={guest_id} type={guest_type} node={node_name}",
+            )
+        ssh_cmd = _build_ssh_command(node, _sudo_remote_command(remote, "-n", script=script))
         _log_debug(args, f"→ SSH: {_format_ssh_command(ssh_cmd)}")
     result = _run_ssh_sudo_command(
-        node.host,
-        node.user.name,
-        node.port,
-        f"{command} {args.action} {guest_id}",
-        identity_file=node.user.identity_file,
-        identities_only=node.user.identities_only,
-        ssh_options=node.ssh_options,
+        node,
+        remote,
+        script=script,
+        capture_stdout=False,
     )
-    combined = (result.stdout or "") + (result.stderr or "")
-    _log_debug(args, f"→ stdout: {result.stdout or ''}")
-    _log_debug(args, f"→ stderr: {result.stderr or ''}")
+    # stdout was streamed to the terminal; sudo and qm/pct errors arrive on
+    # stderr, which is all that needs inspecting here.
+    stderr = result.stderr or ""
+    _log_debug(args, f"→ stderr: {stderr}")
 
     if result.returncode == 0:
-        if result.stdout:
-            print(result.stdout, end="")
-        verb_map = {
-            "start": "started",
-            "stop": "stopped",
-            "status": "status checked",
-            "shutdown": "shut down",
-            "reboot": "rebooted",
-        }
-        verb = verb_map.get(args.action, args.action)
-        print(f"OK: {guest_type} {guest_name} ({guest_id}) {verb} on {node_name}")
+        _report_guest_actions(args, node_name, guests)
         return 0
 
-    if _is_sudo_password_required(combined):
+    succeeded = any(
+        marker.group(2) == "0" for marker in _GUEST_RESULT_RE.finditer(stderr)
+    )
+    if not succeeded and _is_sudo_password_required("", stderr):
         if not args.askpass:
-            _print_error(_sudo_required_message(command, node_name, node.host))
+            _print_error(_sudo_required_message(command_label, node_name, node.host))
             return EXIT_SUDO
-        retry_code, retry_stdout, _retry_error = _run_sudo_with_password_retry(
+        retry_code, _retry_stdout, retry_error = _run_sudo_with_password_retry(
             args,
             node_name,
             node,
-            f"{command} {args.action} {guest_id}",
-            command,
+            remote,
+            command_label,
+            emit_errors=False,
+            script=script,
+            capture_stdout=False,
         )
         if retry_code == 0:
-            if retry_stdout:
-                print(retry_stdout, end="")
-            verb_map = {
-                "start": "started",
-                "stop": "stopped",
-                "status": "status checked",
-                "shutdown": "shut down",
-                "reboot": "rebooted",
-            }
-            verb = verb_map.get(args.action, args.action)
-            print(f"OK: {guest_type} {guest_name} ({guest_id}) {verb} on {node_name}")
+            _report_guest_actions(args, node_name, guests)
+            return 0
+        _report_guest_actions(args, node_name, guests, retry_error or "Remote command failed")
         return retry_code
 
-    _print_error(combined.strip() or "Remote command failed")
+    _report_guest_actions(args, node_name, guests, stderr or "Remote command failed")
     return EXIT_REMOTE
 
 
-def _parse_guest_table(output: str) -> list[tuple[int, str, str]]:
-    lines = [line for line in output.splitlines() if line.strip()]
-    if not lines:
-        return []
-    header_tokens = [token.upper() for token in lines[0].split()]
-    header_map = {name: idx for idx, name in enumerate(header_tokens)}
+def _handle_vm_action(args: argparse.Namespace) -> int:
+    config = _load_config_from_args(args)
 
-    def _find_index(candidates: tuple[str, ...]) -> int | None:
-        for candidate in candidates:
-            if candidate in header_map:
-                return header_map[candidate]
-        return None
+    # Resolve every target before touching any node, then run the actions
+    # node by node in the order the guests were given.
+    guests_by_node: dict[str, list[tuple[str, int, str]]] = {}
+    for target in args.vmnames:
+        node_name, guest_type, guest_id, guest_name = _resolve_guest_target(config, target)
+        guests = guests_by_node.setdefault(node_name, [])
+        if (guest_type, guest_id, guest_name) not in guests:
+            guests.append((guest_type, guest_id, guest_name))
+
+    exit_code = 0
+    for node_name, guests in guests_by_node.items():
+        node_code = _run_node_guest_actions(args, node_name, config.nodes[node_name], guests)
+        if node_code and not exit_code:
+            exit_code = node_code
+    return exit_code
+
+
+def _guest_row_pattern(column_count: int) -> re.Pattern[str]:
+    # Matches the first column_count whitespace-separated columns of a row;
+    # rows with fewer columns do not match and are skipped.
+    columns = r"[ \t]+".join([r"(\S+)"] * column_count)
+    return re.compile(rf"^[ \t]*{columns}", re.MULTILINE)
+
+
+def _find_column(header_map: dict[str, int], candidates: tuple[str, ...]) -> int | None:
+    for candidate in candidates:
+        if candidate in header_map:
+            return header_map[candidate]
+    return None
 
-    id_idx = _find_index(("VMID", "CTID", "ID"))
-    name_idx = _find_index(("NAME",))
-    status_idx = _find_index(("STATUS", "STATE"))
-    if id_idx is None or name_idx is None or status_idx is None:
-        return []
-
-    rows: list[tuple[int, str, str]] = []
-    max_idx = max(id_idx, name_idx, status_idx)
-    for line in lines[1:]:
-        parts = line.split()
-        if len(parts) <= max_idx:
-            continue
+
+def _iter_guest_rows(
+    output: str,
+    columns: tuple[tuple[str, ...], ...],
+) -> Iterator[tuple[Any, ...]]:
+    # Yields (vmid, *values) for the requested columns, matching only as many
+    # leading columns as needed. Rows lacking them or with a non-numeric ID
+    # are skipped.
+    header = _TABLE_HEADER_RE.search(output)
+    if header is None:
+        return
+    header_map = {token.upper(): idx for idx, token in enumerate(header.group().split())}
+    indexes = [_find_column(header_map, candidates) for candidates in (ID_COLUMNS, *columns)]
+    if None in indexes:
+        return
+    pattern = _guest_row_pattern(max(indexes) + 1)
+    groups = [idx + 1 for idx in indexes]
+    for match in pattern.finditer(output, header.end()):
+        values = match.group(*groups)
         try:
-            vmid = int(parts[id_idx])
+            vmid = int(values[0])
         except ValueError:
             continue
-        name = parts[name_idx]
-        status = parts[status_idx]
-        rows.append((vmid, name, status))
-    return rows
+        yield (vmid, *values[1:])
 
 
 def _parse_status_map(output: str) -> dict[int, str]:
-    statuses: dict[int, str] = {}
-    for vmid, _name, status in _parse_guest_table(output):
-        statuses[vmid] = status
-    return statuses
+    # Only ID and status are matched, so pct list rows with an empty Lock
+    # column (which shifts Name left) still yield a status.
+    return {vmid: status for vmid, status in _iter_guest_rows(output, (STATUS_COLUMNS,))}
 
 
 def _parse_pct_status(output: str) -> str | None:
-    for line in output.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        lower = stripped.lower()
-        if lower.startswith("status:"):
-            return stripped.split(":", 1)[1].strip()
-    return None
+    match = _PCT_STATUS_RE.search(output)
+    return match.group(1).strip() if match else None
 
 
 def _run_remote_command_with_askpass(
@@ -349,37 +594,36 @@ def _run_remote_command_with_askpass(
     command: str,
     command_label: str,
     emit_errors: bool = True,
+    script: bool = False,
+    prompt: bool = True,
+    log: bool = True,
 ) -> tuple[int, str, str]:
-    _log_verbose(args, f"→ Target node: {node_name} ({node.host})")
-    _log_verbose(args, f"→ Executing: {command}")
-    if args.debug:
-        ssh_cmd = _build_ssh_command(
-            node.host,
-            node.user.name,
-            node.port,
-            f"sudo -n {command}",
-            identity_file=node.user.identity_file,
-            identities_only=node.user.identities_only,
-            ssh_options=node.ssh_options,
-        )
-        _log_debug(args, f"→ SSH: {_format_ssh_command(ssh_cmd)}")
+    # Callers running this in a worker thread pass log=False and do their own
+    # logging, so lines from different nodes do not interleave.
+    if log:
+        _log_verbose(args, f"→ Target node: {node_name} ({node.host})")
+        _log_verbose(args, f"→ Executing: {command}")
+        if args.debug:
+            ssh_cmd = _build_ssh_command(
+                node,
+                _sudo_remote_command(command, "-n", script=script),
+            )
+            _log_debug(args, f"→ SSH: {_format_ssh_command(ssh_cmd)}")
     result = _run_ssh_sudo_command(
-        node.host,
-        node.user.name,
-        node.port,
+        node,
         command,
-        identity_file=node.user.identity_file,
-        identities_only=node.user.identities_only,
-        ssh_options=node.ssh_options,
+        script=script,
     )
-    combined = (result.stdout or "") + (result.stderr or "")
-    _log_debug(args, f"→ stdout: {result.stdout or ''}")
-    _log_debug(args, f"→ stderr: {result.stderr or ''}")
+    stdout = result.stdout or ""
+    stderr = result.stderr or ""
+    if log:
+        _log_debug(args, f"→ stdout: {stdout}")
+        _log_debug(args, f"→ stderr: {stderr}")
 
     if result.returncode == 0:
-        return 0, result.stdout or "", ""
+        return 0, stdout, ""
 
-    if _is_sudo_password_required(combined):
+    if _is_sudo_password_required(stdout, stderr):
         if not args.askpass:
             message = _sudo_required_message(command_label, node_name, node.host)
             if emit_errors:
@@ -392,61 +636,109 @@ def _run_remote_command_with_askpass(
             command,
             command_label,
             emit_errors=emit_errors,
+            script=script,
+            prompt=prompt,
+            log=log,
         )
 
-    message = combined.strip() or "Remote command failed"
+    # Both streams are only joined on this failure path, for the message.
+    message = (stdout + stderr).strip() or "Remote command failed"
     if emit_errors:
         _print_error(message)
     return EXIT_REMOTE, "", message
 
 
-def _run_remote_qm_list(
-    args: argparse.Namespace,
-    node_name: str,
-    node,
-    emit_errors: bool = True,
-) -> tuple[int, str, str]:
-    return _run_remote_command_with_askpass(
-        args,
-        node_name,
-        node,
-        "/usr/sbin/qm list",
-        "qm",
-        emit_errors=emit_errors,
+def _build_list_script(query_vms: bool, lxc_ids: list[int]) -> str:
+    # Only query what the node has configured; sections that are left out
+    # simply parse as empty tables.
+    script = ""
+    if query_vms:
+        script += "qm_list=$(run_sudo /usr/sbin/qm list) || exit $?\n"
+    if lxc_ids:
+        script += "pct_list=$(run_sudo /usr/sbin/pct list) || exit $?\n"
+    if query_vms:
+        script += f'echo {LIST_QM_MARKER}\nprintf "%s\\n" "$qm_list"\n'
+    if lxc_ids:
+        script += f'echo {LIST_PCT_MARKER}\nprintf "%s\\n" "$pct_list"\n'
+        # Ask pct status only for configured LXCs that pct list did not report
+        # with a usable status, inside the same session. One awk pass works out
+        # the missing IDs instead of a printf|awk|grep pipeline per container.
+        joined_ids = " ".join(str(ctid) for ctid in lxc_ids)
+        script += (
+            'missing=$(printf "%s\\n" "$pct_list" | awk'
+            f' -v ids="{joined_ids}"'
+            " 'BEGIN { n = split(ids, a, \" \"); for (i = 1; i <= n; i++) want[a[i]] = 1 }"
+            ' NR > 1 && tolower($2) != "unknown" { delete want[$1] }'
+            " END { for (id in want) print id }')\n"
+            "for id in $missing; do\n"
+            f'  echo "{LIST_PCT_STATUS_MARKER}$id"\n'
+            # A CTID the node no longer has makes pct status fail; that only
+            # leaves the guest "unknown" and must not fail the whole node.
+            '  run_sudo /usr/sbin/pct status "$id" 2>&1 || :\n'
+            "done\n"
+        )
+    return script
+
+
+def _split_list_bundle(output: str) -> tuple[str, str, dict[int, str]]:
+    qm_output = ""
+    pct_output = ""
+    pct_status_outputs: dict[int, str] = {}
+    markers = list(_LIST_MARKER_RE.finditer(output))
+    for idx, marker in enumerate(markers):
+        end = markers[idx + 1].start() if idx + 1 < len(markers) else len(output)
+        section = output[marker.end() + 1 : end]
+        if marker.group(1) is not None:
+            pct_status_outputs[int(marker.group(1))] = section
+        elif marker.group() == LIST_QM_MARKER:
+            qm_output = section
+        else:
+            pct_output = section
+    return qm_output, pct_output, pct_status_outputs
+
+
+def _list_bundle_command(node) -> tuple[str, str]:
+    lxc_ids = list(node.lxcs.values())
+    command_label = "/".join(
+        label for label, wanted in (("qm", bool(node.vms)), ("pct", bool(lxc_ids))) if wanted
     )
+    return _build_list_script(bool(node.vms), lxc_ids), command_label
 
 
-def _run_remote_pct_list(
+def _run_remote_list_bundle(
     args: argparse.Namespace,
     node_name: str,
     node,
     emit_errors: bool = True,
+    prompt: bool = True,
 ) -> tuple[int, str, str]:
+    command, command_label = _list_bundle_command(node)
     return _run_remote_command_with_askpass(
         args,
         node_name,
         node,
-        "/usr/sbin/pct list",
-        "pct",
+        command,
+        command_label,
         emit_errors=emit_errors,
+        script=True,
+        prompt=prompt,
+        log=False,
     )
 
 
-def _run_remote_pct_status(
-    args: argparse.Namespace,
-    node_name: str,
-    node,
-    ctid: int,
-    emit_errors: bool = True,
-) -> tuple[int, str, str]:
-    return _run_remote_command_with_askpass(
-        args,
-        node_name,
-        node,
-        f"/usr/sbin/pct status {ctid}",
-        "pct",
-        emit_errors=emit_errors,
-    )
+def _log_list_commands(args: argparse.Namespace, node_name: str, node) -> None:
+    # The list script is an implementation detail; -v shows the commands it
+    # runs and only --debug shows the script itself.
+    _log_verbose(args, f"→ Target node: {node_name} ({node.host})")
+    if node.vms:
+        _log_verbose(args, "→ Executing: /usr/sbin/qm list")
+    if node.lxcs:
+        _log_verbose(args, "→ Executing: /usr/sbin/pct list")
+        _log_verbose(args, "→ Executing: /usr/sbin/pct status <id> (LXCs pct list leaves unknown)")
+    if args.debug:
+        command, _command_label = _list_bundle_command(node)
+        ssh_cmd = _build_ssh_command(node, _sudo_remote_command(command, "-n", script=True))
+        _log_debug(args, f"→ SSH: {_format_ssh_command(ssh_cmd)}")
 
 
 def _confirm_node_action(node_name: str, action: str) -> bool:
@@ -494,7 +786,39 @@ def _handle_node_action(args: argparse.Namespace) -> int:
     return 0
 
 
+def _parse_node_guests(
+    node_name: str,
+    node,
+    list_output: str,
+    state_filter: str | None = None,
+) -> list[GuestRow]:
+    # state_filter is a lowercase status ("running"/"stopped"); rows are
+    # filtered as they are built, lowercasing each status once.
+    guests: list[GuestRow] = []
+    qm_output, pct_output, pct_status_outputs = _split_list_bundle(list_output)
+    vm_statuses = _parse_status_map(qm_output)
+    for name, vmid in node.vms.items():
+        status = vm_statuses.get(vmid, "unknown")
+        if state_filter is None or status.lower() == state_filter:
+            guests.append(GuestRow(node_name, vmid, name, status, "VM"))
+
+    lxc_statuses = _parse_status_map(pct_output)
+    for name, vmid in node.lxcs.items():
+        status = lxc_statuses.get(vmid, "unknown")
+        state = status.lower()
+        if state == "unknown" and vmid in pct_status_outputs:
+            fallback_status = _parse_pct_status(pct_status_outputs[vmid])
+            if fallback_status:
+                status = fallback_status
+                state = status.lower()
+        if state_filter is None or state == state_filter:
+            guests.append(GuestRow(node_name, vmid, name, status, "LXC"))
+    return guests
+
+
 def _handle_list(args: argparse.Namespace) -> int:
+    from concurrent.futures import ThreadPoolExecutor
+
     config = _load_config_from_args(args)
     if args.node:
         node = config.nodes.get(args.node)
@@ -505,119 +829,122 @@ def _handle_list(args: argparse.Namespace) -> int:
     else:
         nodes = config.nodes
 
-    guests: list[tuple[str, int, str, str, str]] = []
+    guests: list[GuestRow] = []
     failures: list[tuple[str, str, int, str]] = []
-    for node_name in sorted(nodes):
-        node = nodes[node_name]
-        qm_code, qm_output, qm_error = _run_remote_qm_list(
-            args,
-            node_name,
-            node,
-            emit_errors=args.strict,
-        )
-        if qm_code != 0:
-            if args.strict:
-                return qm_code
-            failures.append((node_name, node.host, node.port, qm_error or "Remote command failed"))
-            continue
-        pct_code, pct_output, pct_error = _run_remote_pct_list(
-            args,
-            node_name,
-            node,
-            emit_errors=args.strict,
-        )
-        if pct_code != 0:
-            if args.strict:
-                return pct_code
-            failures.append((node_name, node.host, node.port, pct_error or "Remote command failed"))
-            continue
-        vm_statuses = _parse_status_map(qm_output)
-        for name, vmid in node.vms.items():
-            status = vm_statuses.get(vmid, "unknown")
-            guests.append((node_name, vmid, name, status, "VM"))
-
-        lxc_statuses = _parse_status_map(pct_output)
-        for name, vmid in node.lxcs.items():
-            status = lxc_statuses.get(vmid, "unknown")
-            if status.lower() == "unknown":
-                status_code, status_output, status_error = _run_remote_pct_status(
+    state_filter = "running" if args.running else "stopped" if args.stopped else None
+
+    # Only the ssh round trips run in the pool; parsing, errors and password
+    # prompts happen here, in sorted node order, so output and --strict exit
+    # codes are deterministic and getpass never runs in a worker thread.
+    queried = sorted(name for name, node in nodes.items() if node.vms or node.lxcs)
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(queried)))) as executor:
+        futures = {
+            node_name: executor.submit(
+                _run_remote_list_bundle,
+                args,
+                node_name,
+                nodes[node_name],
+                emit_errors=False,
+                prompt=False,
+            )
+            for node_name in queried
+        }
+        for idx, node_name in enumerate(queried):
+            node = nodes[node_name]
+            _log_list_commands(args, node_name, node)
+            list_code, list_output, list_error = futures[node_name].result()
+            if list_code == _NEEDS_SUDO_PASSWORD:
+                list_code, list_output, list_error = _run_sudo_with_password_retry(
                     args,
                     node_name,
                     node,
-                    vmid,
-                    emit_errors=args.strict,
+                    *_list_bundle_command(node),
+                    emit_errors=False,
+                    script=True,
                 )
-                if status_code != 0:
-                    if args.strict:
-                        return status_code
-                    failures.append(
-                        (node_name, node.host, node.port, status_error or "Remote command failed")
-                    )
-                    continue
-                fallback_status = _parse_pct_status(status_output)
-                if fallback_status:
-                    status = fallback_status
-            guests.append((node_name, vmid, name, status, "LXC"))
-
-    if args.running:
-        guests = [guest for guest in guests if guest[3].lower() == "running"]
-    elif args.stopped:
-        guests = [guest for guest in guests if guest[3].lower() == "stopped"]
-
-    guests.sort(key=lambda guest: (guest[0], guest[1]))
+                if list_code == 0:
+                    # Later nodes already waiting for a password retry with
+                    # this one in the pool; unfinished ones pick it up from
+                    # the cache themselves.
+                    for later in queried[idx + 1 :]:
+                        future = futures[later]
+                        if future.done() and future.result()[0] == _NEEDS_SUDO_PASSWORD:
+                            futures[later] = executor.submit(
+                                _run_sudo_with_password_retry,
+                                args,
+                                later,
+                                nodes[later],
+                                *_list_bundle_command(nodes[later]),
+                                emit_errors=False,
+                                script=True,
+                                prompt=False,
+                                log=False,
+                            )
+            if list_code != 0:
+                if args.strict:
+                    # Fail fast: drop queued work and stop the other nodes'
+                    # ssh calls so leaving the pool does not wait on them.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    _abort_ssh_processes()
+                    _print_error(list_error or "Remote command failed")
+                    return list_code
+                failures.append(
+                    (node_name, node.host, node.port, list_error or "Remote command failed")
+                )
+                continue
+            _log_debug(args, f"→ stdout: {list_output}")
+            guests.extend(_parse_node_guests(node_name, node, list_output, state_filter))
+
+    guests.sort(key=attrgetter("node_name", "vmid"))
 
     node_order: list[str] = []
-    rows_by_node: dict[str, list[tuple[int, str, str, str]]] = {}
-    for node_name, vmid, name, status, guest_type in guests:
-        if node_name not in rows_by_node:
-            rows_by_node[node_name] = []
-            node_order.append(node_name)
-        rows_by_node[node_name].append((vmid, name, status, guest_type))
-
-    for idx, node_name in enumerate(node_order):
-        rows = rows_by_node[node_name]
-        id_width = max([len("ID")] + [len(str(row[0])) for row in rows])
-        name_width = max([len("NAME")] + [len(row[1]) for row in rows])
-        status_width = max([len("STATUS")] + [len(row[2]) for row in rows])
-        type_width = max([len("TYPE")] + [len(row[3]) for row in rows])
-
-        print(f"NODE: {node_name}")
-        header = (
-            f"{'ID'.ljust(id_width)} "
-            f"{'NAME'.ljust(name_width)} "
-            f"{'STATUS'.ljust(status_width)} "
-            f"{'TYPE'.ljust(type_width)}"
-        )
-        print(f"  {header}")
-        for vmid, name, status, guest_type in rows:
-            line = (
-                f"{str(vmid).ljust(id_width)} "
-                f"{name.ljust(name_width)} "
-                f"{status.ljust(status_width)} "
-                f"{guest_type.ljust(type_width)}"
-            )
-            print(f"  {line}")
-        if idx != len(node_order) - 1:
-            print()
+    rows_by_node: dict[str, list[GuestRow]] = {}
+    for guest in guests:
+        if guest.node_name not in rows_by_node:
+            rows_by_node[guest.node_name] = []
+            node_order.append(guest.node_name)
+        rows_by_node[guest.node_name].append(guest)
+
+    # The whole report is assembled first and written with a single call.
+    lines: list[str] = []
+    header = ("ID", "NAME", "STATUS", "TYPE")
+    for node_name in node_order:
+        if lines:
+            lines.append("")
+        # Stringify each row once; the same cells feed the widths and the output.
+        rows = [
+            (str(row.vmid), row.name, row.status, row.guest_type)
+            for row in rows_by_node[node_name]
+        ]
+        widths = [max(map(len, column)) for column in zip(header, *rows)]
+        row_format = "  " + " ".join(f"{{:<{width}}}" for width in widths)
+        lines.append(f"NODE: {node_name}")
+        lines.append(row_format.format(*header))
+        lines.extend(row_format.format(*row) for row in rows)
 
     if failures:
-        if node_order:
-            print()
-        print("FAILED NODES")
-        for node_name, host, port, message in failures:
-            print(f"  {node_name} ({host}:{port}): {message}")
+        if lines:
+            lines.append("")
+        lines.append("FAILED NODES")
+        lines.extend(
+            f"  {node_name} ({host}:{port}): {message}"
+            for node_name, host, port, message in failures
+        )
         if not node_order:
-            print("No nodes reachable.")
-        return 1
-    return 0
+            lines.append("No nodes reachable.")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return 1 if failures else 0
 
 
 def _handle_vm_list(args: argparse.Namespace) -> int:
     config = _load_config_from_args(args)
-    print("NAME\tVMID\tNODE")
-    for name in sorted(config.vm_index):
-        node_name, vmid = config.vm_index[name]
-        print(f"{name}\t{vmid}\t{node_name}")
+    lines = ["NAME\tVMID\tNODE"]
+    lines.extend(
+        f"{name}\t{vmid}\t{node_name}"
+        for name, (node_name, vmid) in config.vm_index.items()
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -629,10 +956,17 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--askpass",
-        action=argparse.BooleanOptionalAction,
-        default=True,
+        dest="askpass",
+        action="store_true",
         help="Prompt for sudo password if needed (default: enabled)",
     )
+    parser.add_argument(
+        "--no-askpass",
+        dest="askpass",
+        action="store_false",
+        help="Fail instead of prompting when sudo needs a password",
+    )
+    parser.set_defaults(askpass=True)
     parser.add_argument(
         "-v",
         "--verbose",
@@ -647,9 +981,14 @@ def _build_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    for action in ("start", "stop", "status", "shutdown", "reboot"):
+    for action in GUEST_ACTIONS:
         sub = subparsers.add_parser(action, help=f"qm {action} <vmid>")
-        sub.add_argument("vmname", help="Guest name or numeric ID")
+        sub.add_argument(
+            "vmnames",
+            nargs="+",
+            metavar="vmname",
+            help="Guest name or numeric ID (several may be given)",
+        )
         sub.set_defaults(func=_handle_vm_action, action=action)
 
     list_parser = subparsers.add_parser("list", help="List VMs and LXCs across nodes")
@@ -693,11 +1032,40 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _parse_fast_path(argv: list[str]) -> argparse.Namespace | None:
+    # `vmctl <action> <guest>...` is the most common invocation; answer it
+    # without building the full parser. Anything else, including any flag,
+    # goes through argparse. Defaults must mirror _build_parser.
+    if (
+        len(argv) < 2
+        or argv[0] not in GUEST_ACTIONS
+        or any(arg.startswith("-") for arg in argv[1:])
+    ):
+        return None
+    return argparse.Namespace(
+        config=None,
+        askpass=True,
+        verbose=False,
+        debug=False,
+        command=argv[0],
+        action=argv[0],
+        vmnames=argv[1:],
+        func=_handle_vm_action,
+    )
+
+
 def main(argv: list[str] | None = None) -> None:
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_fast_path(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
     if args.debug:
         args.verbose = True
+    try:
+        os.makedirs(os.path.expanduser(SSH_CONTROL_DIR), mode=0o700, exist_ok=True)
+    except OSError:
+        pass
     exit_code = args.func(args)
     raise SystemExit(exit_code)
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import os
+import pickle
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, NamedTuple
 
 
 class ConfigError(RuntimeError):
@@ -15,10 +17,21 @@ DEFAULT_CONFIG_PATHS = [
     Path("vmctl.yaml"),
     Path("~/.config/vmctl-ng/config.yaml").expanduser(),
 ]
+# str forms for the lookup in find_config_path, which runs on every call.
+_DEFAULT_CONFIG_PATH_STRS = [os.fspath(p) for p in DEFAULT_CONFIG_PATHS]
+
+CONFIG_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "vmctl-ng" / "config.pkl"
+)
+# Bump whenever the shape of Config or its members changes so stale pickles
+# from an older vmctl-ng are ignored.
+_CONFIG_CACHE_VERSION = 6
 
 
-@dataclass(frozen=True)
-class NodeConfig:
+# Per-node records are plain named tuples: cheap to build in the load loop
+# and immutable like the dataclasses. Config holds the mutable indexes and
+# stays a dataclass.
+class NodeConfig(NamedTuple):
     name: str
     host: str
     user: "UserConfig"
@@ -26,27 +39,34 @@ class NodeConfig:
     lxcs: dict[str, int]
     ssh_options: list[str]
     port: int = 22
+    ssh_multiplex: bool = True
+    ssh_compression: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     nodes: dict[str, NodeConfig]
+    # Kept in name order so `vm list` can dump it without sorting.
     vm_index: dict[str, tuple[str, int]]
     defaults: "DefaultsConfig"
+    # (node_name, guest_type, guest_id, guest_name) for every VM and LXC,
+    # keyed by name and by numeric ID. Lists so ambiguity can be reported.
+    guest_name_index: dict[str, list[tuple[str, str, int, str]]]
+    guest_id_index: dict[int, list[tuple[str, str, int, str]]]
 
 
-@dataclass(frozen=True)
-class UserConfig:
+class UserConfig(NamedTuple):
     name: str
     identity_file: str | None
     identities_only: bool
 
 
-@dataclass(frozen=True)
-class DefaultsConfig:
+class DefaultsConfig(NamedTuple):
     port: int
     user: UserConfig
     ssh_options: list[str]
+    ssh_multiplex: bool = True
+    ssh_compression: bool = False
 
 
 def _require_mapping(value: Any, label: str) -> dict[str, Any]:
@@ -104,14 +124,22 @@ def _require_ssh_options(value: Any, label: str) -> list[str]:
     return options
 
 
+@lru_cache(maxsize=64)
+def _expand_identity_file(path: str) -> str:
+    # Nodes usually share a handful of key paths; expand each one once.
+    return sys.intern(str(Path(path).expanduser()))
+
+
 def _require_user(value: Any, label: str) -> UserConfig:
     user_map = _require_mapping(value, label)
-    name = _require_str(user_map.get("name"), f"{label}.name")
+    # User names, hosts and key paths repeat across nodes; interning makes
+    # the copies share one string (and one entry in the pickled cache).
+    name = sys.intern(_require_str(user_map.get("name"), f"{label}.name"))
     identity_raw = user_map.get("identity_file")
     identity_file = None
     if identity_raw is not None:
         identity_file = _require_str(identity_raw, f"{label}.identity_file")
-        identity_file = str(Path(identity_file).expanduser())
+        identity_file = _expand_identity_file(identity_file)
     identities_raw = user_map.get("identities_only")
     if identities_raw is None:
         identities_only = identity_file is not None
@@ -131,16 +159,26 @@ def find_config_path(override: str | None) -> Path:
             raise ConfigError(f"Config file not found: {path}")
         return path
 
-    for path in DEFAULT_CONFIG_PATHS:
-        if path.is_file():
-            return path
+    for path_str in _DEFAULT_CONFIG_PATH_STRS:
+        if os.path.isfile(path_str):
+            return Path(path_str)
     paths = ", ".join(str(p) for p in DEFAULT_CONFIG_PATHS)
     raise ConfigError(f"No config file found. Tried: {paths}")
 
 
 def load_config(path: Path) -> Config:
+    # Imported here so runs served from the config cache never load PyYAML.
+    import yaml
+
+    try:
+        # libyaml-backed loader; several times faster than the pure-Python one.
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as _YamlLoader
+
     try:
-        raw = yaml.safe_load(path.read_text())
+        # Bytes go straight to the parser, which does its own UTF-8 decoding.
+        raw = yaml.load(path.read_bytes(), Loader=_YamlLoader)
     except OSError as exc:
         raise ConfigError(f"Failed to read config: {exc}") from exc
     except yaml.YAMLError as exc:
@@ -167,25 +205,39 @@ def load_config(path: Path) -> Config:
     defaults_user = _require_user(defaults_user_raw, "defaults.user")
     defaults_port = _require_port(defaults_raw.get("port"), "defaults.port")
     defaults_ssh_options = _require_ssh_options(defaults_raw.get("ssh_options"), "defaults.ssh_options")
+    defaults_multiplex_raw = defaults_raw.get("ssh_multiplex")
+    defaults_ssh_multiplex = (
+        True
+        if defaults_multiplex_raw is None
+        else _require_bool(defaults_multiplex_raw, "defaults.ssh_multiplex")
+    )
+    defaults_ssh_compression = _require_bool(
+        defaults_raw.get("ssh_compression"), "defaults.ssh_compression"
+    )
     defaults = DefaultsConfig(
         port=defaults_port,
         user=defaults_user,
         ssh_options=defaults_ssh_options,
+        ssh_multiplex=defaults_ssh_multiplex,
+        ssh_compression=defaults_ssh_compression,
     )
 
     nodes: dict[str, NodeConfig] = {}
     vm_index: dict[str, tuple[str, int]] = {}
+    guest_name_index: dict[str, list[tuple[str, str, int, str]]] = {}
+    guest_id_index: dict[int, list[tuple[str, str, int, str]]] = {}
 
     for node_name, node_data in nodes_raw.items():
         if not isinstance(node_name, str) or not node_name.strip():
             raise ConfigError("Node names must be non-empty strings")
+        node_name = sys.intern(node_name)
         node_map = _require_mapping(node_data, f"nodes.{node_name}")
         if "identity_file" in node_map or "identities_only" in node_map:
             raise ConfigError(
                 f"nodes.{node_name} uses deprecated keys identity_file/identities_only; "
                 "use user.name/user.identity_file/user.identities_only"
             )
-        host = _require_str(node_map.get("host"), f"nodes.{node_name}.host")
+        host = sys.intern(_require_str(node_map.get("host"), f"nodes.{node_name}.host"))
         user_block = node_map.get("user", defaults.user)
         if isinstance(user_block, UserConfig):
             user = user_block
@@ -195,10 +247,29 @@ def load_config(path: Path) -> Config:
                     f"nodes.{node_name}.user must be a mapping with name and optional identity_file/identities_only"
                 )
             user = _require_user(user_block, f"nodes.{node_name}.user")
-        port = _require_port(node_map.get("port", defaults.port), f"nodes.{node_name}.port")
-        ssh_options = _require_ssh_options(
-            node_map.get("ssh_options", defaults.ssh_options),
-            f"nodes.{node_name}.ssh_options",
+        # Omitted keys fall back to the defaults, which are already validated.
+        if "port" in node_map:
+            port = _require_port(node_map["port"], f"nodes.{node_name}.port")
+        else:
+            port = defaults.port
+        if "ssh_options" in node_map:
+            ssh_options = _require_ssh_options(
+                node_map["ssh_options"],
+                f"nodes.{node_name}.ssh_options",
+            )
+        else:
+            ssh_options = defaults.ssh_options
+        multiplex_raw = node_map.get("ssh_multiplex")
+        ssh_multiplex = (
+            defaults.ssh_multiplex
+            if multiplex_raw is None
+            else _require_bool(multiplex_raw, f"nodes.{node_name}.ssh_multiplex")
+        )
+        compression_raw = node_map.get("ssh_compression")
+        ssh_compression = (
+            defaults.ssh_compression
+            if compression_raw is None
+            else _require_bool(compression_raw, f"nodes.{node_name}.ssh_compression")
         )
         vms = _require_vms(node_map.get("vms"), f"nodes.{node_name}.vms")
         lxcs = _require_vms(node_map.get("lxcs"), f"nodes.{node_name}.lxcs")
@@ -211,18 +282,68 @@ def load_config(path: Path) -> Config:
             vms=vms,
             lxcs=lxcs,
             ssh_options=ssh_options,
+            ssh_multiplex=ssh_multiplex,
+            ssh_compression=ssh_compression,
         )
         nodes[node_name] = node_cfg
 
-        for vm_name, vmid in vms.items():
-            if vm_name in vm_index:
-                prev_node = vm_index[vm_name][0]
-                raise ConfigError(
-                    f"VM name '{vm_name}' is duplicated in nodes '{prev_node}' and '{node_name}'"
-                )
-            vm_index[vm_name] = (node_name, vmid)
+        duplicates = vm_index.keys() & vms.keys()
+        if duplicates:
+            vm_name = next(name for name in vms if name in duplicates)
+            prev_node = vm_index[vm_name][0]
+            raise ConfigError(
+                f"VM name '{vm_name}' is duplicated in nodes '{prev_node}' and '{node_name}'"
+            )
+        vm_index |= {vm_name: (node_name, vmid) for vm_name, vmid in vms.items()}
+
+        for guest_type, guests in (("VM", vms), ("LXC", lxcs)):
+            for guest_name, guest_id in guests.items():
+                entry = (node_name, guest_type, guest_id, guest_name)
+                guest_name_index.setdefault(guest_name, []).append(entry)
+                guest_id_index.setdefault(guest_id, []).append(entry)
 
     if not nodes:
         raise ConfigError("No nodes configured")
 
-    return Config(nodes=nodes, vm_index=vm_index, defaults=defaults)
+    return Config(
+        nodes=nodes,
+        vm_index=dict(sorted(vm_index.items())),
+        defaults=defaults,
+        guest_name_index=guest_name_index,
+        guest_id_index=guest_id_index,
+    )
+
+
+def _write_config_cache(key: tuple[Any, ...], config: Config) -> None:
+    import tempfile
+
+    try:
+        CONFIG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=CONFIG_CACHE_PATH.parent,
+            prefix=".config.",
+            delete=False,
+        ) as fh:
+            pickle.dump((key, config), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fh.name, CONFIG_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def load_config_cached(path: Path) -> Config:
+    try:
+        stat = path.stat()
+    except OSError as exc:
+        raise ConfigError(f"Failed to read config: {exc}") from exc
+    key = (_CONFIG_CACHE_VERSION, str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    try:
+        with CONFIG_CACHE_PATH.open("rb") as fh:
+            cached_key, cached_config = pickle.load(fh)
+        if cached_key == key:
+            return cached_config
+    except Exception:
+        # A missing, stale or unreadable cache is just a miss.
+        pass
+    config = load_config(path)
+    _write_config_cache(key, config)
+    return config